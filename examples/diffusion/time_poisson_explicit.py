@@ -66,7 +66,10 @@ solvers = {
         'dt' : 0.00002,
         'n_step' : None,
         'mass' : 'dw_volume_dot.i1.Omega( s, T )',
-        'lumped' : False, # If True, lump mass matrix so that it is diagonal.
+        # If True or 'row_sum', lump mass matrix so that it is diagonal by
+        # summing its rows, if 'hrz', scale its diagonal to preserve the total
+        # mass.
+        'lumped' : False,
     }),
 }
 